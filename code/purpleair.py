@@ -3,6 +3,7 @@
 PurpleAir Sensor Data Retrieval
 
 CHANGELOG
+* 2026-10-19: Cached request plans, keep-alive reuse, collect only on low heap
 * 2025-12-28: Temperature and Humidity estimation functions
 * 2025-12-23: Fix 0.0 bug, pass api_key to PurpleAirClient
 * 2025-12-14: Require instantion with requests library
@@ -19,6 +20,12 @@ RED   = (255, 0, 0)
 PURPLE = (143, 63, 151)
 MAROON = (126, 0, 35)
 
+API_HOST = "api.purpleair.com"
+BASE_URL = f"https://{API_HOST}/v1"
+
+# Only run gc.collect() when free heap drops below this many bytes
+GC_FREE_THRESHOLD = 32 * 1024
+
 def url_encode(string: str) -> str:
     encoded_string = ""
     for character in string:
@@ -29,6 +36,53 @@ def url_encode(string: str) -> str:
     return encoded_string
 
 
+def collect_if_low(threshold: int = GC_FREE_THRESHOLD) -> bool:
+    """
+    Run gc.collect() only if free heap is below threshold bytes.
+
+    gc.mem_free() only exists on CircuitPython/MicroPython; elsewhere the
+    host interpreter manages memory and nothing is collected.
+
+    Returns:
+        bool: True if a collection was run
+    """
+    mem_free = getattr(gc, "mem_free", None)
+    if mem_free is None or mem_free() >= threshold:
+        return False
+    gc.collect()
+    return True
+
+
+class RequestPlan:
+    """Precomputed URL and headers for one (sensor, fields) request."""
+
+    def __init__(self, api_key: str, sensor_id: int | str, field_list: list[str] | str) -> None:
+        """
+        Build the request URL and headers once so repeated polls reuse them.
+
+        Args:
+            api_key: PurpleAir API key
+            sensor_id (str or int): ID of the sensor to query
+            field_list (list or str): List of fields to retrieve
+
+        Raises:
+            ValueError: If field_list is not a list or string
+        """
+        if isinstance(field_list, list):
+            fields = ','.join(field_list)
+        elif isinstance(field_list, str):
+            fields = field_list
+        else:
+            raise ValueError("field_list must be a list or a string")
+
+        self.url = f"{BASE_URL}/sensors/{sensor_id}?fields={url_encode(fields)}"
+        self.headers = {
+            "X-API-Key": api_key,
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        }
+
+
 class PurpleAirClient:
     """Client for fetching data from PurpleAir API."""
     
@@ -37,11 +91,32 @@ class PurpleAirClient:
         Initialize PurpleAir client with a requests library implementation.
         
         Args:
-            requests: HTTP requests library (e.g., adafruit_requests or standard requests)
+            requests: HTTP requests library (e.g., adafruit_requests or standard requests).
+                Pass a session object so the keep-alive socket to the API is reused.
             api_key: PurpleAir API key
         """
         self.requests = requests
         self.api_key = api_key
+        self._plans = {}
+
+    def get_plan(self, sensor_id: int | str, field_list: list[str] | str) -> RequestPlan:
+        """
+        Return the cached RequestPlan for a (sensor, fields) pair, building it on first use.
+
+        Raises:
+            ValueError: If field_list is not a list or string
+        """
+        if not isinstance(field_list, (list, str)):
+            raise ValueError("field_list must be a list or a string")
+
+        fields_key = tuple(field_list) if isinstance(field_list, list) else field_list
+        # Include the API key so reassigning client.api_key never reuses stale headers
+        key = (self.api_key, sensor_id, fields_key)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = RequestPlan(self.api_key, sensor_id, field_list)
+            self._plans[key] = plan
+        return plan
     
     def fetch_sensor_data(self, sensor_id: int | str, field_list: list[str] | str) -> dict:
         """
@@ -58,35 +133,21 @@ class PurpleAirClient:
             ValueError: If field_list is not a list or string
             Exception: For API errors, network errors, or data parsing issues
         """
-        base_url = "https://api.purpleair.com/v1"
-        endpoint = f"/sensors/{sensor_id}"
-        url = f"{base_url}{endpoint}"
-
-        headers = {
-            "X-API-Key": self.api_key,
-            "Content-Type": "application/json"
-        }
-
-        if isinstance(field_list, list):
-            fields = ','.join(field_list)
-        elif isinstance(field_list, str):
-            fields = field_list
-        else:
-            raise ValueError("field_list must be a list or a string")
-
-        param_string = "fields=" + url_encode(fields)
+        plan = self.get_plan(sensor_id, field_list)
 
         print(f"Fetching data for sensor {sensor_id}")
-        # Collect garbage before making the request to free up memory on constrained devices
-        gc.collect()
-        response = self.requests.get(url + "?" + param_string, headers=headers)
-        gc.collect()
+        # Free memory on constrained devices, but only when the heap is actually low
+        collect_if_low()
+        response = self.requests.get(plan.url, headers=plan.headers)
 
-        # Check if request was successful
+        # Check if request was successful. Reading the body fully lets the
+        # session hand the socket back for reuse on the next poll.
         if response.status_code == 200:
             return response.json()
         else:
             error_msg = f"API request failed with status code {response.status_code}: {response.text}"
+            if hasattr(response, "close"):
+                response.close()
             print(error_msg)
             raise Exception(error_msg)
 
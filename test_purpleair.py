@@ -180,6 +180,64 @@ def test_fetch_sensor_data_invalid_field_list():
         assert "must be a list or a string" in str(e), f"Expected validation error, got: {e}"
         print("  ✓ Invalid field_list type properly rejected")
 
+    for invalid in ({"name": 1}, {"name"}, bytearray(b"name")):
+        try:
+            client.fetch_sensor_data(sensor_id=123, field_list=invalid)
+            assert False, f"Expected ValueError for {type(invalid).__name__} but none was raised"
+        except ValueError as e:
+            assert "must be a list or a string" in str(e), f"Expected validation error, got: {e}"
+    print("  ✓ Unhashable field_list types properly rejected")
+
+
+def test_request_plan_cached():
+    """Test that request plans are built once per (sensor, fields) pair."""
+    print("\nTest: request_plan_cached")
+
+    mock_requests = MockRequests(response_data={"sensor": {}})
+    client = purpleair.PurpleAirClient(mock_requests, api_key="key")
+
+    client.fetch_sensor_data(sensor_id=123, field_list=["name", "pm2.5"])
+    first_url = mock_requests.last_url
+    first_headers = mock_requests.last_headers
+    client.fetch_sensor_data(sensor_id=123, field_list=["name", "pm2.5"])
+
+    assert mock_requests.last_url is first_url, "URL was rebuilt for the same plan"
+    assert mock_requests.last_headers is first_headers, "Headers were rebuilt for the same plan"
+    assert first_url == "https://api.purpleair.com/v1/sensors/123?fields=name%2cpm2%2e5", f"Unexpected URL: {first_url}"
+    assert first_headers["Connection"] == "keep-alive", "Keep-alive header not set"
+
+    client.fetch_sensor_data(sensor_id=123, field_list="name")
+    assert mock_requests.last_url is not first_url, "Different fields should use a different plan"
+    assert client.get_plan(123, ["name", "pm2.5"]) is client.get_plan(123, ["name", "pm2.5"]), "Plan not reused"
+    assert client.get_plan(123, "name") is not client.get_plan(123, ["name", "pm2.5"]), "Different fields share a plan"
+
+    client.api_key = "new_key"
+    client.fetch_sensor_data(sensor_id=123, field_list=["name", "pm2.5"])
+    assert mock_requests.last_headers["X-API-Key"] == "new_key", "Stale API key reused after change"
+    print("  ✓ Request plans cached and reused")
+
+
+def test_collect_if_low():
+    """Test that garbage collection only runs when free heap is low."""
+    print("\nTest: collect_if_low")
+
+    gc = purpleair.gc
+    original = getattr(gc, "mem_free", None)
+    try:
+        gc.mem_free = lambda: 1024
+        assert purpleair.collect_if_low(threshold=2048), "Expected collection when heap is low"
+        gc.mem_free = lambda: 4096
+        assert not purpleair.collect_if_low(threshold=2048), "Unexpected collection with free heap"
+    finally:
+        if original is None:
+            del gc.mem_free
+        else:
+            gc.mem_free = original
+
+    if original is None:
+        assert not purpleair.collect_if_low(), "Should not collect without gc.mem_free"
+    print("  ✓ Collection only runs below threshold")
+
 
 def test_stateless_functions():
     """Test that stateless utility functions work correctly."""
@@ -218,6 +276,8 @@ def run_all_tests():
     test_fetch_sensor_data_api_error()
     test_fetch_sensor_data_network_error()
     test_fetch_sensor_data_invalid_field_list()
+    test_request_plan_cached()
+    test_collect_if_low()
     test_stateless_functions()
     
     print("\n" + "=" * 60)